@@ -0,0 +1,59 @@
+"""Track startup import cost with ``python -X importtime``.
+
+Fails if the lightweight entry points pull in heavy dependencies eagerly.
+
+Usage: python benchmarks/bench_import_time.py
+"""
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+HEAVY_MODULES = ("pandas", "numpy", "statsmodels", "yfinance", "scipy", "numba")
+
+ENTRY_POINTS = {
+    "import src": [sys.executable, "-X", "importtime", "-c", "import src"],
+    "run_backtest.py --help": [sys.executable, "-X", "importtime", "run_backtest.py", "--help"],
+}
+
+
+def import_profile(cmd: list[str]) -> tuple[dict[str, int], set[str]]:
+    """Return cumulative microseconds per top-level import and all imported packages."""
+    proc = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True, check=True)
+    top_level: dict[str, int] = {}
+    packages: set[str] = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cum, raw_name = line[len("import time:") :].split("|")
+        if not cum.strip().isdigit():
+            continue
+        name = raw_name.strip()
+        packages.add(name.split(".")[0])
+        # nested imports are indented under their parent
+        if len(raw_name) - len(raw_name.lstrip()) == 1:
+            top_level[name] = int(cum)
+    return top_level, packages
+
+
+def main() -> None:
+    failed = False
+    for label, cmd in ENTRY_POINTS.items():
+        profile, packages = import_profile(cmd)
+        total_ms = sum(profile.values()) / 1000
+        heavy = sorted(m for m in HEAVY_MODULES if m in packages)
+        slowest = sorted(profile.items(), key=lambda kv: kv[1], reverse=True)[:5]
+        print(f"{label}: {total_ms:.1f} ms")
+        for name, us in slowest:
+            print(f"    {name:<28} {us / 1000:8.1f} ms")
+        if heavy:
+            print(f"    eagerly imported heavy modules: {', '.join(heavy)}")
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
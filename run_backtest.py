@@ -2,15 +2,7 @@ from __future__ import annotations
 
 import argparse
 
-import pandas as pd
-
-from src.attribution import AttributionEngine
-from src.backtest import Backtester
-from src.data import DataLoader
-from src.factors import FactorModel
-from src.portfolio import PortfolioConstructor
-from src.reporting import ReportExporter
-from src.robustness import RobustnessAnalyzer
+from src.pipeline import PipelineGraph
 
 DEFAULT_TICKERS = [
     "AAPL",
@@ -36,76 +28,144 @@ DEFAULT_TICKERS = [
 ]
 
 
-def run_pipeline(
+PIPELINE_STAGES = [
+    "data",
+    "technical_factors",
+    "fundamental_factors",
+    "standardize",
+    "composite",
+    "construct",
+    "backtest",
+    "attribution",
+    "robustness",
+    "export",
+]
+
+DEFAULT_TARGETS = ["export", "attribution", "robustness"]
+
+FACTOR_WEIGHTS = {
+    "value": 0.25,
+    "momentum": 0.25,
+    "quality": 0.20,
+    "low_vol": 0.15,
+    "size": 0.10,
+    "trend": 0.05,
+}
+
+STRESS_WINDOWS = {
+    "covid_crash": ("2020-02-01", "2020-04-30"),
+    "rate_shock_2022": ("2022-01-01", "2022-12-31"),
+    "recent": ("2023-01-01", "2024-12-31"),
+}
+
+
+def build_pipeline(
     start: str,
     end: str,
     rebalance: str,
     transaction_cost_bps: float,
     method: str,
-):
-    data_loader = DataLoader(DEFAULT_TICKERS)
-    bundle = data_loader.build_bundle(start, end)
+) -> PipelineGraph:
+    # Stage modules pull in pandas/numpy; import them after argument parsing.
+    from src.attribution import AttributionEngine
+    from src.backtest import Backtester
+    from src.data import DataLoader
+    from src.factors import FactorModel
+    from src.portfolio import PortfolioConstructor
+    from src.reporting import ReportExporter
+    from src.robustness import RobustnessAnalyzer
 
     factor_model = FactorModel()
-    tech = factor_model.build_technical_factors(bundle.prices)
-    fund = factor_model.build_fundamental_factors(
-        bundle.fundamentals,
-        dates=bundle.prices.index,
-        market_caps=bundle.market_caps,
-    )
 
-    raw_factors = {**tech, **fund}
-    std_factors = factor_model.combine_and_standardize(raw_factors)
-
-    factor_weights = {
-        "value": 0.25,
-        "momentum": 0.25,
-        "quality": 0.20,
-        "low_vol": 0.15,
-        "size": 0.10,
-        "trend": 0.05,
-    }
-
-    score = factor_model.composite_score(std_factors, factor_weights)
-    constructor = PortfolioConstructor()
-    returns = bundle.prices.pct_change().fillna(0)
-    weights = constructor.construct(score, returns, bundle.sectors, method=method)
-
-    backtester = Backtester(transaction_cost_bps=transaction_cost_bps, periods_per_year=(12 if rebalance == "M" else 52))
-    result = backtester.run(bundle.prices, bundle.benchmark, weights, rebalance=rebalance)
-
-    attribution = AttributionEngine()
-    factor_contrib = attribution.factor_contribution(result.weights, std_factors, result.portfolio_returns)
-    regime = attribution.regime_attribution(result.portfolio_returns, result.benchmark_returns)
-
-    robustness = RobustnessAnalyzer()
-    mc = robustness.monte_carlo_ci(result.portfolio_returns)
-    stress = robustness.stress_period_performance(
-        result.portfolio_returns,
-        windows={
-            "covid_crash": ("2020-02-01", "2020-04-30"),
-            "rate_shock_2022": ("2022-01-01", "2022-12-31"),
-            "recent": ("2023-01-01", "2024-12-31"),
-        },
-    )
+    def data():
+        return DataLoader(DEFAULT_TICKERS).build_bundle(start, end)
+
+    def technical_factors(data):
+        return factor_model.build_technical_factors(data.prices)
+
+    def fundamental_factors(data):
+        return factor_model.build_fundamental_factors(
+            data.fundamentals,
+            dates=data.prices.index,
+            market_caps=data.market_caps,
+        )
+
+    def standardize(technical_factors, fundamental_factors):
+        return factor_model.combine_and_standardize({**technical_factors, **fundamental_factors})
+
+    def composite(standardize):
+        return factor_model.composite_score(standardize, FACTOR_WEIGHTS)
+
+    def construct(composite, data):
+        returns = data.prices.pct_change().fillna(0)
+        return PortfolioConstructor().construct(composite, returns, data.sectors, method=method)
+
+    def backtest(construct, data):
+        backtester = Backtester(transaction_cost_bps=transaction_cost_bps, periods_per_year=(12 if rebalance == "M" else 52))
+        return backtester.run(data.prices, data.benchmark, construct, rebalance=rebalance)
+
+    def attribution(backtest, standardize):
+        engine = AttributionEngine()
+        factor_contrib = engine.factor_contribution(backtest.weights, standardize, backtest.portfolio_returns)
+        regime = engine.regime_attribution(backtest.portfolio_returns, backtest.benchmark_returns)
+        output_dir = ReportExporter().output_dir
+        factor_contrib.to_csv(output_dir / "factor_contribution.csv")
+        regime.to_csv(output_dir / "regime_attribution.csv")
+        return {"factor_contribution": factor_contrib, "regime": regime}
+
+    def robustness(backtest):
+        analyzer = RobustnessAnalyzer()
+        mc = analyzer.monte_carlo_ci(backtest.portfolio_returns)
+        stress = analyzer.stress_period_performance(backtest.portfolio_returns, windows=STRESS_WINDOWS)
+        output_dir = ReportExporter().output_dir
+        mc.to_csv(output_dir / "monte_carlo_ci.csv", index=False)
+        stress.to_csv(output_dir / "stress_test.csv", index=False)
+        return {"monte_carlo": mc, "stress": stress}
+
+    def export(backtest):
+        exporter = ReportExporter()
+        exporter.export_all(
+            holdings=backtest.weights,
+            transactions=backtest.transactions,
+            metrics=backtest.metrics,
+            portfolio_returns=backtest.portfolio_returns,
+            benchmark_returns=backtest.benchmark_returns,
+        )
+        return exporter.output_dir
+
+    graph = PipelineGraph()
+    graph.add("data", data)
+    graph.add("technical_factors", technical_factors, ["data"])
+    graph.add("fundamental_factors", fundamental_factors, ["data"])
+    graph.add("standardize", standardize, ["technical_factors", "fundamental_factors"])
+    graph.add("composite", composite, ["standardize"])
+    graph.add("construct", construct, ["composite", "data"])
+    graph.add("backtest", backtest, ["construct", "data"])
+    graph.add("attribution", attribution, ["backtest", "standardize"])
+    graph.add("robustness", robustness, ["backtest"])
+    graph.add("export", export, ["backtest"])
+    return graph
 
-    exporter = ReportExporter()
-    exporter.export_all(
-        holdings=result.weights,
-        transactions=result.transactions,
-        metrics=result.metrics,
-        portfolio_returns=result.portfolio_returns,
-        benchmark_returns=result.benchmark_returns,
-        factor_contrib=factor_contrib,
-    )
-    regime.to_csv("outputs/regime_attribution.csv")
-    mc.to_csv("outputs/monte_carlo_ci.csv", index=False)
-    stress.to_csv("outputs/stress_test.csv", index=False)
 
-    print("=== Performance Summary ===")
-    print(result.metrics.round(4))
-    print("\n=== Regime Attribution ===")
-    print(regime.round(4))
+def run_pipeline(
+    start: str,
+    end: str,
+    rebalance: str,
+    transaction_cost_bps: float,
+    method: str,
+    targets: list[str] | None = None,
+    max_workers: int = 4,
+):
+    graph = build_pipeline(start, end, rebalance, transaction_cost_bps, method)
+    outputs = graph.run(targets or DEFAULT_TARGETS, max_workers=max_workers)
+
+    result = outputs.get("backtest")
+    if result is not None:
+        print("=== Performance Summary ===")
+        print(result.metrics.round(4))
+    if "attribution" in outputs:
+        print("\n=== Regime Attribution ===")
+        print(outputs["attribution"]["regime"].round(4))
 
     return result
 
@@ -121,6 +181,14 @@ def main() -> None:
         choices=["equal_weighted", "score_weighted", "risk_parity"],
         default="score_weighted",
     )
+    parser.add_argument(
+        "--targets",
+        nargs="+",
+        choices=PIPELINE_STAGES,
+        default=DEFAULT_TARGETS,
+        help="pipeline stages to compute; their dependencies run automatically",
+    )
+    parser.add_argument("--max-workers", type=int, default=4)
     args = parser.parse_args()
 
     run_pipeline(
@@ -129,6 +197,8 @@ def main() -> None:
         rebalance=args.rebalance,
         transaction_cost_bps=args.transaction_cost_bps,
         method=args.method,
+        targets=args.targets,
+        max_workers=args.max_workers,
     )
 
 
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from run_backtest import DEFAULT_TICKERS, FACTOR_WEIGHTS
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve incremental target portfolios over HTTP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--state", default="outputs/service_state.pkl", help="snapshot file; restored on startup if present")
+    parser.add_argument("--history-start", default=None, help="bootstrap price history start (default: 2 years ago)")
+    parser.add_argument(
+        "--method",
+        choices=["equal_weighted", "score_weighted", "risk_parity"],
+        default="score_weighted",
+    )
+    args = parser.parse_args()
+
+    import pandas as pd
+
+    from src.data import DataLoader
+    from src.live import RebalanceService, make_server
+
+    state = Path(args.state)
+    if state.exists():
+        service = RebalanceService.restore(state)
+        print(f"Restored state from {state} (as of {service.as_of})")
+    else:
+        today = pd.Timestamp.today().normalize()
+        start = args.history_start or (today - pd.DateOffset(years=2)).strftime("%Y-%m-%d")
+        bundle = DataLoader(DEFAULT_TICKERS).build_bundle(start, today.strftime("%Y-%m-%d"))
+        service = RebalanceService.from_bundle(bundle, FACTOR_WEIGHTS, method=args.method, snapshot_path=state)
+        service.snapshot()
+        print(f"Bootstrapped {len(service.prices.columns)} assets through {service.as_of}")
+
+    server = make_server(service, args.host, args.port)
+    print(f"Listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.snapshot()
+
+
+if __name__ == "__main__":
+    main()
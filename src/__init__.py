@@ -1,19 +1,56 @@
 """Multi-factor portfolio construction package."""
 
-from .attribution import AttributionEngine
-from .backtest import Backtester
-from .data import DataLoader
-from .factors import FactorModel
-from .portfolio import PortfolioConstructor
-from .reporting import ReportExporter
-from .robustness import RobustnessAnalyzer
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .attribution import AttributionEngine
+    from .backtest import Backtester
+    from .data import DataLoader
+    from .factors import FactorModel
+    from .pipeline import PipelineGraph
+    from .portfolio import PortfolioConstructor
+    from .live import RebalanceService
+    from .reporting import ReportExporter
+    from .robustness import RobustnessAnalyzer
+
+# Submodules are imported on first attribute access so that `import src` stays
+# cheap for CLI startup and short-lived sweep workers.
+_EXPORTS = {
+    "AttributionEngine": ".attribution",
+    "Backtester": ".backtest",
+    "DataLoader": ".data",
+    "FactorModel": ".factors",
+    "PipelineGraph": ".pipeline",
+    "PortfolioConstructor": ".portfolio",
+    "RebalanceService": ".live",
+    "ReportExporter": ".reporting",
+    "RobustnessAnalyzer": ".robustness",
+}
 
 __all__ = [
     "AttributionEngine",
     "Backtester",
     "DataLoader",
     "FactorModel",
+    "PipelineGraph",
     "PortfolioConstructor",
+    "RebalanceService",
     "ReportExporter",
     "RobustnessAnalyzer",
 ]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import numpy as np
 import pandas as pd
-import statsmodels.api as sm
+
+from .metrics import max_drawdowns
 
 
 class AttributionEngine:
@@ -32,6 +33,8 @@ class AttributionEngine:
         data = pd.concat([portfolio_returns.rename("strategy"), ff_factors], axis=1).dropna()
         if data.empty:
             return pd.Series(dtype=float)
+        import statsmodels.api as sm
+
         y = data["strategy"]
         x = sm.add_constant(data.drop(columns=["strategy"]))
         model = sm.OLS(y, x).fit()
@@ -40,17 +43,63 @@ class AttributionEngine:
         out["alpha_tstat"] = model.tvalues.get("const", np.nan)
         return out
 
+    @staticmethod
+    def benchmark_regimes(benchmark_returns: pd.Series) -> pd.Series:
+        """Label each period ``bull`` or ``bear`` by the sign of the benchmark return."""
+        bm = benchmark_returns.dropna()
+        return pd.Series(np.where(bm >= 0, "bull", "bear"), index=bm.index, name="regime")
+
+    @staticmethod
+    def volatility_regimes(
+        benchmark_returns: pd.Series,
+        window: int = 12,
+        n_regimes: int = 3,
+        labels: list[str] | None = None,
+    ) -> pd.Series:
+        """Bucket periods into quantiles of trailing benchmark volatility (terciles by default)."""
+        if labels is None:
+            labels = ["low_vol", "mid_vol", "high_vol"] if n_regimes == 3 else [f"vol_q{i + 1}" for i in range(n_regimes)]
+        vol = benchmark_returns.rolling(window).std().dropna()
+        return pd.qcut(vol, n_regimes, labels=labels).rename("regime")
+
+    def regime_attribution_batch(
+        self,
+        returns: pd.DataFrame,
+        regimes: pd.Series,
+    ) -> pd.DataFrame:
+        """Per-regime statistics for every column of a (dates x strategies) matrix.
+
+        ``regimes`` maps dates to any number of regime labels; dates without a label
+        are ignored. Returns one row per (regime, strategy).
+        """
+        labels = regimes.reindex(returns.index)
+        data = returns[labels.notna()]
+        labels = labels[labels.notna()]
+        grouped = data.groupby(labels, observed=True, sort=True)
+        regime_index = list(grouped.groups)
+
+        stats = {
+            "periods": grouped.count(),
+            "mean_return": grouped.mean(),
+            "vol": grouped.std(),
+            "hit_rate": data.gt(0).groupby(labels, observed=True).sum() / grouped.count(),
+            "max_drawdown": pd.DataFrame({r: max_drawdowns(data[labels == r]) for r in regime_index}).T,
+        }
+        index = pd.MultiIndex.from_product([regime_index, returns.columns], names=["regime", "strategy"])
+        return pd.DataFrame(
+            {
+                name: frame.reindex(index=regime_index, columns=returns.columns).to_numpy().ravel()
+                for name, frame in stats.items()
+            },
+            index=index,
+        )
+
     def regime_attribution(
         self,
         portfolio_returns: pd.Series,
         benchmark_returns: pd.Series,
     ) -> pd.DataFrame:
         df = pd.concat([portfolio_returns.rename("strategy"), benchmark_returns.rename("benchmark")], axis=1).dropna()
-        df["regime"] = np.where(df["benchmark"] >= 0, "bull", "bear")
-        summary = df.groupby("regime").agg(
-            periods=("strategy", "size"),
-            mean_return=("strategy", "mean"),
-            vol=("strategy", "std"),
-            hit_rate=("strategy", lambda x: (x > 0).mean()),
-        )
-        return summary
+        batch = self.regime_attribution_batch(df[["strategy"]], self.benchmark_regimes(df["benchmark"]))
+        summary = batch.xs("strategy", level="strategy")[["periods", "mean_return", "vol", "hit_rate"]]
+        return summary.rename_axis("regime")
@@ -5,7 +5,6 @@ from typing import Iterable
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
 
 
 @dataclass
@@ -25,6 +24,8 @@ class DataLoader:
         self.benchmark = benchmark
 
     def load_prices(self, start: str, end: str) -> pd.DataFrame:
+        import yfinance as yf
+
         px = yf.download(
             self.tickers,
             start=start,
@@ -37,6 +38,8 @@ class DataLoader:
         return px.sort_index().dropna(how="all")
 
     def load_benchmark(self, start: str, end: str) -> pd.Series:
+        import yfinance as yf
+
         bm = yf.download(
             self.benchmark,
             start=start,
@@ -47,6 +50,8 @@ class DataLoader:
         return bm.sort_index().rename("benchmark")
 
     def load_fundamentals_snapshot(self) -> tuple[pd.DataFrame, pd.Series, pd.DataFrame]:
+        import yfinance as yf
+
         rows: list[dict] = []
         sectors: dict[str, str] = {}
         mkt_caps: dict[str, float] = {}
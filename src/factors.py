@@ -1,12 +1,27 @@
 from __future__ import annotations
 
+from importlib.util import find_spec
+
 import numpy as np
 import pandas as pd
 
+# pandas < 3 forward-fills prices inside the default ``pct_change()``; pandas 3
+# removed the fill. The fused kernel follows whichever behaviour is installed.
+PCT_CHANGE_PADS = int(pd.__version__.split(".")[0]) < 3
+
 
 class FactorModel:
-    def __init__(self, winsor_pct: float = 0.01) -> None:
+    """Builds and standardizes technical and fundamental factor panels.
+
+    With ``use_numba`` the technical factors come from the fused kernel, which
+    always computes and returns float64. It matches the pandas path exactly for
+    float64 prices only: pandas computes float32 returns in float32, so other
+    input dtypes agree only to float32 precision.
+    """
+
+    def __init__(self, winsor_pct: float = 0.01, use_numba: bool = True) -> None:
         self.winsor_pct = winsor_pct
+        self.use_numba = use_numba and find_spec("numba") is not None
 
     @staticmethod
     def _zscore_cross_section(df: pd.DataFrame) -> pd.DataFrame:
@@ -20,6 +35,34 @@ class FactorModel:
         return df.clip(lower=low, upper=high, axis=0)
 
     def build_technical_factors(self, prices: pd.DataFrame) -> dict[str, pd.DataFrame]:
+        if self.use_numba:
+            return self._build_technical_factors_fused(prices)
+        return self._build_technical_factors_pandas(prices)
+
+    def _build_technical_factors_fused(self, prices: pd.DataFrame) -> dict[str, pd.DataFrame]:
+        # numba is imported (and the kernel loaded) only when this path is used.
+        # find_spec in __init__ is only a cheap early check: numba can be installed
+        # but fail to import, and then the kernel would run as plain Python.
+        from .kernels import NUMBA_AVAILABLE, technical_factors_kernel
+
+        if not NUMBA_AVAILABLE:
+            return self._build_technical_factors_pandas(prices)
+
+        values = np.asfortranarray(prices.to_numpy(dtype=np.float64))
+        mom, low_vol, trend, rsi = technical_factors_kernel(values, PCT_CHANGE_PADS)
+
+        def frame(arr: np.ndarray) -> pd.DataFrame:
+            return pd.DataFrame(arr, index=prices.index, columns=prices.columns, copy=False)
+
+        return {
+            "momentum": frame(mom),
+            "low_vol": frame(low_vol),
+            "trend": frame(trend),
+            "rsi": frame(rsi),
+        }
+
+    @staticmethod
+    def _build_technical_factors_pandas(prices: pd.DataFrame) -> dict[str, pd.DataFrame]:
         returns = prices.pct_change()
 
         mom_12_1 = prices.shift(21).pct_change(252)
@@ -81,6 +124,24 @@ class FactorModel:
             cleaned[name] = self._zscore_cross_section(c)
         return cleaned
 
+    def standardize_cross_section(self, raw_factors: dict[str, pd.Series]) -> dict[str, pd.Series]:
+        """Single-date ``combine_and_standardize`` on plain arrays, for low-latency scoring."""
+        cleaned: dict[str, pd.Series] = {}
+        for name, row in raw_factors.items():
+            v = row.to_numpy(dtype=np.float64, copy=True)
+            v[np.isinf(v)] = np.nan
+            missing = np.isnan(v)
+            if missing.all() or len(v) < 2:
+                cleaned[name] = pd.Series(np.nan, index=row.index)
+                continue
+            v[missing] = np.median(v[~missing])
+            low, high = np.quantile(v, [self.winsor_pct, 1 - self.winsor_pct])
+            v = np.clip(v, low, high)
+            std = v.std(ddof=1)
+            z = (v - v.mean()) / std if std > 0 else np.full_like(v, np.nan)
+            cleaned[name] = pd.Series(z, index=row.index)
+        return cleaned
+
     def composite_score(
         self,
         standardized_factors: dict[str, pd.DataFrame],
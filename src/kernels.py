@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import math
+import os
+
+import numpy as np
+
+try:
+    from numba import config, njit, prange
+
+    NUMBA_AVAILABLE = True
+    # Pipeline stages run on a thread pool; TBB can hang at interpreter exit after
+    # a parallel region was launched from a worker thread, so prefer OpenMP.
+    if "NUMBA_THREADING_LAYER" not in os.environ and "NUMBA_THREADING_LAYER_PRIORITY" not in os.environ:
+        config.THREADING_LAYER_PRIORITY = ["omp", "tbb", "workqueue"]
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+# The rolling updates below follow pandas' window aggregations (Kahan-compensated
+# running sums for means, Welford's method for variances, same add/remove order)
+# so the fused kernel reproduces the pandas reference path value for value.
+
+
+@njit(cache=True, error_model="numpy")
+def _window_value(x: float) -> float:
+    # pandas treats +/-inf as missing inside rolling windows
+    if math.isinf(x):
+        return np.nan
+    return x
+
+
+@njit(cache=True, error_model="numpy")
+def _calc_mean(minp, nobs, neg_ct, sum_x, same_ct, prev_value):
+    if nobs >= minp and nobs > 0:
+        result = sum_x / nobs
+        if same_ct >= nobs:
+            result = prev_value
+        elif neg_ct == 0 and result < 0:
+            result = 0.0
+        elif neg_ct == nobs and result > 0:
+            result = 0.0
+        return result
+    return np.nan
+
+
+@njit(cache=True, error_model="numpy")
+def _calc_std(minp, nobs, ssqdm_x, same_ct):
+    if nobs >= minp and nobs > 1:
+        if same_ct >= nobs:
+            return 0.0
+        var = ssqdm_x / (nobs - 1.0)
+        return math.sqrt(var) if var >= 0 else 0.0
+    return np.nan
+
+
+@njit(cache=True, error_model="numpy")
+def _pct_change(col, t, lag):
+    if t < lag:
+        return np.nan
+    return col[t] / col[t - lag] - 1.0
+
+
+@njit(cache=True, error_model="numpy")
+def _diff(col, t):
+    if t < 1:
+        return np.nan
+    return col[t] - col[t - 1]
+
+
+@njit(cache=True, error_model="numpy")
+def _gain(col, t):
+    d = _diff(col, t)
+    if d != d:
+        return d
+    return d if d >= 0 else 0.0
+
+
+@njit(cache=True, error_model="numpy")
+def _loss(col, t):
+    d = _diff(col, t)
+    if d != d:
+        return d
+    return -d if d <= 0 else -0.0
+
+
+@njit(cache=True, error_model="numpy")
+def _technical_factors_column(col, pad_returns, mom_out, vol_out, trend_out, rsi_out):
+    n = col.shape[0]
+    ann = math.sqrt(252.0)
+
+    # Return-based factors read prices through ``px``: with ``pad_returns`` the last
+    # valid price is carried forward first, as pandas 2.x ``pct_change()`` does.
+    px = np.empty(n)
+    last = np.nan
+    for t in range(n):
+        if pad_returns and col[t] != col[t]:
+            px[t] = last
+        else:
+            px[t] = col[t]
+            last = col[t]
+
+    # 63-day return volatility (Welford)
+    v_nobs = 0.0
+    v_mean = 0.0
+    v_ssq = 0.0
+    v_comp_add = 0.0
+    v_comp_rem = 0.0
+    v_same = 0
+    v_prev = _window_value(_pct_change(px, 0, 1))
+
+    # 50/200-day SMAs and 14-day gain/loss means (Kahan)
+    s50_nobs = 0
+    s50_neg = 0
+    s50_sum = 0.0
+    s50_comp_add = 0.0
+    s50_comp_rem = 0.0
+    s50_same = 0
+    s50_prev = _window_value(col[0]) if n > 0 else np.nan
+
+    s200_nobs = 0
+    s200_neg = 0
+    s200_sum = 0.0
+    s200_comp_add = 0.0
+    s200_comp_rem = 0.0
+    s200_same = 0
+    s200_prev = s50_prev
+
+    g_nobs = 0
+    g_neg = 0
+    g_sum = 0.0
+    g_comp_add = 0.0
+    g_comp_rem = 0.0
+    g_same = 0
+    g_prev = _window_value(_gain(col, 0))
+
+    l_nobs = 0
+    l_neg = 0
+    l_sum = 0.0
+    l_comp_add = 0.0
+    l_comp_rem = 0.0
+    l_same = 0
+    l_prev = _window_value(_loss(col, 0))
+
+    for t in range(n):
+        # momentum 12-1: price 21 days ago vs. 252 days before that
+        if t >= 21 + 252:
+            mom_out[t] = px[t - 21] / px[t - 21 - 252] - 1.0
+        else:
+            mom_out[t] = np.nan
+
+        # ---- volatility window (63) ----
+        if t >= 63:
+            val = _window_value(_pct_change(px, t - 63, 1))
+            if val == val:
+                v_nobs -= 1.0
+                if v_nobs:
+                    prev_mean = v_mean - v_comp_rem
+                    y = val - v_comp_rem
+                    d = y - v_mean
+                    v_comp_rem = d + v_mean - y
+                    v_mean = v_mean - d / v_nobs
+                    v_ssq = v_ssq - (val - prev_mean) * (val - v_mean)
+                else:
+                    v_mean = 0.0
+                    v_ssq = 0.0
+        val = _window_value(_pct_change(px, t, 1))
+        if val == val:
+            v_nobs += 1.0
+            if val == v_prev:
+                v_same += 1
+            else:
+                v_same = 1
+            v_prev = val
+            prev_mean = v_mean - v_comp_add
+            y = val - v_comp_add
+            d = y - v_mean
+            v_comp_add = d + v_mean - y
+            v_mean = v_mean + d / v_nobs
+            v_ssq = v_ssq + (val - prev_mean) * (val - v_mean)
+        vol_out[t] = -(_calc_std(63, v_nobs, v_ssq, v_same) * ann)
+
+        # ---- SMA 50 ----
+        if t >= 50:
+            val = _window_value(col[t - 50])
+            if val == val:
+                s50_nobs -= 1
+                y = -val - s50_comp_rem
+                s = s50_sum + y
+                s50_comp_rem = s - s50_sum - y
+                s50_sum = s
+                if math.copysign(1.0, val) < 0:
+                    s50_neg -= 1
+        val = _window_value(col[t])
+        if val == val:
+            s50_nobs += 1
+            y = val - s50_comp_add
+            s = s50_sum + y
+            s50_comp_add = s - s50_sum - y
+            s50_sum = s
+            if math.copysign(1.0, val) < 0:
+                s50_neg += 1
+            if val == s50_prev:
+                s50_same += 1
+            else:
+                s50_same = 1
+            s50_prev = val
+        sma_50 = _calc_mean(50, s50_nobs, s50_neg, s50_sum, s50_same, s50_prev)
+
+        # ---- SMA 200 ----
+        if t >= 200:
+            val = _window_value(col[t - 200])
+            if val == val:
+                s200_nobs -= 1
+                y = -val - s200_comp_rem
+                s = s200_sum + y
+                s200_comp_rem = s - s200_sum - y
+                s200_sum = s
+                if math.copysign(1.0, val) < 0:
+                    s200_neg -= 1
+        val = _window_value(col[t])
+        if val == val:
+            s200_nobs += 1
+            y = val - s200_comp_add
+            s = s200_sum + y
+            s200_comp_add = s - s200_sum - y
+            s200_sum = s
+            if math.copysign(1.0, val) < 0:
+                s200_neg += 1
+            if val == s200_prev:
+                s200_same += 1
+            else:
+                s200_same = 1
+            s200_prev = val
+        sma_200 = _calc_mean(200, s200_nobs, s200_neg, s200_sum, s200_same, s200_prev)
+        trend_out[t] = sma_50 / sma_200 - 1.0
+
+        # ---- RSI gain window (14) ----
+        if t >= 14:
+            val = _window_value(_gain(col, t - 14))
+            if val == val:
+                g_nobs -= 1
+                y = -val - g_comp_rem
+                s = g_sum + y
+                g_comp_rem = s - g_sum - y
+                g_sum = s
+                if math.copysign(1.0, val) < 0:
+                    g_neg -= 1
+        val = _window_value(_gain(col, t))
+        if val == val:
+            g_nobs += 1
+            y = val - g_comp_add
+            s = g_sum + y
+            g_comp_add = s - g_sum - y
+            g_sum = s
+            if math.copysign(1.0, val) < 0:
+                g_neg += 1
+            if val == g_prev:
+                g_same += 1
+            else:
+                g_same = 1
+            g_prev = val
+        gain = _calc_mean(14, g_nobs, g_neg, g_sum, g_same, g_prev)
+
+        # ---- RSI loss window (14) ----
+        if t >= 14:
+            val = _window_value(_loss(col, t - 14))
+            if val == val:
+                l_nobs -= 1
+                y = -val - l_comp_rem
+                s = l_sum + y
+                l_comp_rem = s - l_sum - y
+                l_sum = s
+                if math.copysign(1.0, val) < 0:
+                    l_neg -= 1
+        val = _window_value(_loss(col, t))
+        if val == val:
+            l_nobs += 1
+            y = val - l_comp_add
+            s = l_sum + y
+            l_comp_add = s - l_sum - y
+            l_sum = s
+            if math.copysign(1.0, val) < 0:
+                l_neg += 1
+            if val == l_prev:
+                l_same += 1
+            else:
+                l_same = 1
+            l_prev = val
+        loss = _calc_mean(14, l_nobs, l_neg, l_sum, l_same, l_prev)
+
+        if loss == 0:
+            loss = np.nan
+        rsi = 100.0 - 100.0 / (1.0 + gain / loss)
+        rsi_out[t] = -abs(rsi - 50.0)
+
+
+@njit(cache=True, parallel=True, error_model="numpy")
+def technical_factors_kernel(prices, pad_returns):
+    """Compute momentum, low-vol, trend and RSI factors in one pass per column.
+
+    ``prices`` is a 2-D float64 array (dates x assets); Fortran order avoids
+    strided column access. ``pad_returns`` forward-fills prices before computing
+    returns. Returns four arrays of the same shape.
+    """
+    n, m = prices.shape
+    mom = np.empty((m, n)).T
+    low_vol = np.empty((m, n)).T
+    trend = np.empty((m, n)).T
+    rsi = np.empty((m, n)).T
+    for j in prange(m):
+        _technical_factors_column(prices[:, j], pad_returns, mom[:, j], low_vol[:, j], trend[:, j], rsi[:, j])
+    return mom, low_vol, trend, rsi
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .factors import FactorModel
+from .portfolio import PortfolioConstructor
+
+# Longest technical look-back: 12-1 momentum reads the price 21 + 252 bars ago.
+LOOKBACK = 21 + 252 + 1
+
+
+@dataclass
+class RebalanceDecision:
+    date: pd.Timestamp
+    weights: pd.Series
+    trades: pd.DataFrame
+
+
+class RebalanceService:
+    """Incremental rebalancer that keeps factor inputs and holdings in memory.
+
+    Only the trailing ``lookback`` price bars are retained, so each update scores a
+    single date instead of replaying the full history through the backtester.
+    """
+
+    def __init__(
+        self,
+        prices: pd.DataFrame,
+        fundamentals: pd.DataFrame,
+        sectors: pd.Series,
+        market_caps: pd.DataFrame,
+        factor_weights: dict[str, float],
+        method: str = "score_weighted",
+        factor_model: FactorModel | None = None,
+        constructor: PortfolioConstructor | None = None,
+        weights: pd.Series | None = None,
+        lookback: int = LOOKBACK,
+        snapshot_path: str | Path | None = None,
+    ) -> None:
+        self.prices = prices.sort_index().tail(lookback)
+        self.fundamentals = fundamentals
+        self.sectors = sectors
+        self.market_caps = market_caps
+        self.factor_weights = dict(factor_weights)
+        self.method = method
+        self.factor_model = factor_model or FactorModel()
+        self.constructor = constructor or PortfolioConstructor()
+        self.weights = weights
+        self.lookback = lookback
+        self.snapshot_path = Path(snapshot_path) if snapshot_path is not None else None
+        self._fund_row: dict[str, pd.Series] | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_bundle(cls, bundle, factor_weights: dict[str, float], **kwargs) -> "RebalanceService":
+        return cls(
+            prices=bundle.prices,
+            fundamentals=bundle.fundamentals,
+            sectors=bundle.sectors,
+            market_caps=bundle.market_caps,
+            factor_weights=factor_weights,
+            **kwargs,
+        )
+
+    @property
+    def as_of(self) -> pd.Timestamp | None:
+        return self.prices.index[-1] if not self.prices.empty else None
+
+    def _fundamental_row(self, dt: pd.Timestamp) -> dict[str, pd.Series]:
+        # Fundamentals are a static snapshot, so their raw factors never change per bar.
+        if self._fund_row is None:
+            fund = self.factor_model.build_fundamental_factors(
+                self.fundamentals,
+                dates=pd.Index([dt]),
+                market_caps=self.market_caps,
+            )
+            self._fund_row = {name: frame.iloc[-1] for name, frame in fund.items()}
+        return self._fund_row
+
+    def _score_latest(self, prices: pd.DataFrame) -> pd.Series:
+        tech = {
+            name: frame.iloc[-1]
+            for name, frame in self.factor_model.build_technical_factors(prices).items()
+        }
+        std_factors = self.factor_model.standardize_cross_section(
+            {**tech, **self._fundamental_row(prices.index[-1])}
+        )
+
+        score = None
+        for name, z in std_factors.items():
+            term = z * self.factor_weights.get(name, 0.0)
+            score = term if score is None else score.add(term, fill_value=0)
+        return score
+
+    @staticmethod
+    def _trades(current: pd.Series, target: pd.Series) -> pd.DataFrame:
+        delta = target - current
+        delta = delta[delta.abs() > 1e-12]
+        return pd.DataFrame(
+            {
+                "ticker": delta.index,
+                "current_weight": current.reindex(delta.index).values,
+                "target_weight": target.reindex(delta.index).values,
+                "trade_weight": delta.values,
+                "side": np.where(delta > 0, "buy", "sell"),
+            }
+        )
+
+    def update(self, bars: pd.DataFrame) -> RebalanceDecision:
+        """Append new price bars (dates x tickers) and return the next target portfolio.
+
+        Every bar must price the whole universe: a missing price would blank the
+        asset's rolling factors for up to 200 bars, so incomplete bars are rejected.
+        """
+        with self._lock:
+            if bars.empty:
+                raise ValueError("No price bars supplied")
+            unknown = bars.columns.difference(self.prices.columns)
+            if len(unknown) > 0:
+                raise ValueError(f"Unknown tickers: {', '.join(map(str, unknown))}")
+            bars = bars.sort_index().reindex(columns=self.prices.columns).astype(float)
+            missing = bars.columns[bars.isna().any()]
+            if len(missing) > 0:
+                raise ValueError(f"Bars missing prices for: {', '.join(map(str, missing))}")
+            if self.as_of is not None and bars.index[0] <= self.as_of:
+                raise ValueError(f"Bars must be newer than {self.as_of.date()}")
+
+            # State is only committed once scoring and the snapshot succeed, so a
+            # failed update can be retried with the same bar.
+            prices = pd.concat([self.prices, bars]).tail(self.lookback)
+            current = (
+                self.weights
+                if self.weights is not None
+                else pd.Series(0.0, index=prices.columns)
+            )
+
+            score = self._score_latest(prices)
+            # risk_parity only looks at the trailing 63 returns
+            returns = prices.tail(64).pct_change().fillna(0)
+            target = self.constructor.target_weights(
+                score, returns, self.sectors, method=self.method, prev=self.weights
+            )
+            if target.empty:
+                target = current
+            target = target.reindex(prices.columns).fillna(0.0)
+
+            decision = RebalanceDecision(prices.index[-1], target, self._trades(current, target))
+            if self.snapshot_path is not None:
+                self._save(self.snapshot_path, prices, target)
+            self.prices = prices
+            self.weights = target
+            return decision
+
+    def _save(self, path: Path, prices: pd.DataFrame, weights: pd.Series | None) -> None:
+        state = {
+            "prices": prices,
+            "fundamentals": self.fundamentals,
+            "sectors": self.sectors,
+            "market_caps": self.market_caps,
+            "factor_weights": self.factor_weights,
+            "method": self.method,
+            "factor_model": self.factor_model,
+            "constructor": self.constructor,
+            "weights": weights,
+            "lookback": self.lookback,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        pd.to_pickle(state, tmp)
+        tmp.replace(path)
+
+    def snapshot(self, path: str | Path | None = None) -> Path:
+        target = Path(path) if path is not None else self.snapshot_path
+        if target is None:
+            raise ValueError("No snapshot path configured")
+        with self._lock:
+            self._save(target, self.prices, self.weights)
+        return target
+
+    @classmethod
+    def restore(cls, path: str | Path, **kwargs) -> "RebalanceService":
+        """Rebuild a service from a snapshot written by ``snapshot``/``update``."""
+        state = pd.read_pickle(path)
+        state.update(kwargs)
+        state.setdefault("snapshot_path", path)
+        return cls(**state)
+
+
+def _bars_from_payload(payload: dict) -> pd.DataFrame:
+    if not isinstance(payload, dict):
+        raise ValueError("Request body must be a JSON object")
+    bars = payload.get("bars", [payload])
+    if not isinstance(bars, list) or not all(isinstance(bar, dict) for bar in bars):
+        raise ValueError("'bars' must be a list of JSON objects")
+    rows = {pd.Timestamp(bar["date"]): bar["prices"] for bar in bars}
+    return pd.DataFrame.from_dict(rows, orient="index")
+
+
+def _decision_payload(decision: RebalanceDecision, latency_ms: float) -> dict:
+    held = decision.weights[decision.weights > 0]
+    return {
+        "date": decision.date.isoformat(),
+        "weights": {ticker: float(w) for ticker, w in held.items()},
+        "trades": decision.trades.to_dict(orient="records"),
+        "latency_ms": round(latency_ms, 3),
+    }
+
+
+def make_server(service: RebalanceService, host: str = "127.0.0.1", port: int = 8765) -> ThreadingHTTPServer:
+    """HTTP API around ``service``.
+
+    GET  /health    service status and last bar date
+    GET  /portfolio current target weights
+    POST /bars      {"date": ..., "prices": {ticker: price}} or {"bars": [...]};
+                    every bar must price every ticker in the universe
+    POST /snapshot  persist state to the configured snapshot path
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status: int, body: dict) -> None:
+            data = json.dumps(body, default=str).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self) -> None:
+            if self.path == "/health":
+                self._send(200, {"status": "ok", "as_of": service.as_of, "assets": len(service.prices.columns)})
+            elif self.path == "/portfolio":
+                weights = service.weights if service.weights is not None else pd.Series(dtype=float)
+                self._send(200, {"as_of": service.as_of, "weights": weights[weights > 0].to_dict()})
+            else:
+                self._send(404, {"error": f"Unknown path: {self.path}"})
+
+        def do_POST(self) -> None:
+            try:
+                if self.path == "/bars":
+                    length = int(self.headers.get("Content-Length", 0))
+                    payload = json.loads(self.rfile.read(length) or b"{}")
+                    start = time.perf_counter()
+                    decision = service.update(_bars_from_payload(payload))
+                    self._send(200, _decision_payload(decision, (time.perf_counter() - start) * 1e3))
+                elif self.path == "/snapshot":
+                    self._send(200, {"path": service.snapshot()})
+                else:
+                    self._send(404, {"error": f"Unknown path: {self.path}"})
+            except (KeyError, TypeError, ValueError) as exc:
+                self._send(400, {"error": str(exc)})
+            except Exception as exc:
+                self._send(500, {"error": f"{type(exc).__name__}: {exc}"})
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    return ThreadingHTTPServer((host, port), Handler)
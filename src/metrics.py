@@ -47,6 +47,21 @@ def drawdown_stats(returns: pd.Series) -> tuple[float, int, pd.Series]:
     return float(max_dd), int(max_duration), dd
 
 
+def max_drawdowns(returns: pd.DataFrame) -> pd.Series:
+    """Max drawdown of each column, computed in one pass over the matrix.
+
+    Columns without a single observation get NaN rather than a zero drawdown.
+    """
+    if returns.empty:
+        return pd.Series(np.nan, index=returns.columns)
+    values = returns.to_numpy(dtype=float)
+    wealth = np.cumprod(1 + np.nan_to_num(values), axis=0)
+    peak = np.maximum.accumulate(wealth, axis=0)
+    max_dd = (wealth / peak - 1).min(axis=0)
+    max_dd[np.isnan(values).all(axis=0)] = np.nan
+    return pd.Series(max_dd, index=returns.columns)
+
+
 def var_cvar(returns: pd.Series, alpha: float = 0.95) -> tuple[float, float]:
     losses = -returns.dropna()
     var = np.quantile(losses, alpha)
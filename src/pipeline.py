@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+
+@dataclass(frozen=True)
+class Node:
+    name: str
+    func: Callable[..., Any]
+    inputs: tuple[str, ...] = ()
+
+
+class PipelineGraph:
+    """Lazy dependency graph of pipeline stages.
+
+    Each node's function is called with the outputs of its ``inputs`` as keyword
+    arguments. Only the ancestors of the requested targets are evaluated, and
+    nodes whose inputs are ready run concurrently on a thread pool.
+    """
+
+    def __init__(self, nodes: Iterable[Node] = ()) -> None:
+        self.nodes: dict[str, Node] = {}
+        for node in nodes:
+            self.add(node.name, node.func, node.inputs)
+
+    def add(self, name: str, func: Callable[..., Any], inputs: Iterable[str] = ()) -> None:
+        if name in self.nodes:
+            raise ValueError(f"Duplicate pipeline node: {name}")
+        self.nodes[name] = Node(name, func, tuple(inputs))
+
+    def dependencies(self, targets: Iterable[str]) -> list[str]:
+        """Return the nodes needed for ``targets`` in topological order."""
+        order: list[str] = []
+        state: dict[str, str] = {}
+
+        def visit(name: str, path: tuple[str, ...]) -> None:
+            if name not in self.nodes:
+                raise KeyError(f"Unknown pipeline node: {name}")
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "active":
+                raise ValueError(f"Cycle in pipeline graph: {' -> '.join(path + (name,))}")
+            state[name] = "active"
+            for dep in self.nodes[name].inputs:
+                visit(dep, path + (name,))
+            state[name] = "done"
+            order.append(name)
+
+        for target in targets:
+            visit(target, ())
+        return order
+
+    def run(self, targets: Iterable[str], max_workers: int = 4) -> dict[str, Any]:
+        """Evaluate ``targets`` and their dependencies; return every computed output."""
+        pending = self.dependencies(targets)
+        results: dict[str, Any] = {}
+        running: dict[Future, str] = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            while pending or running:
+                for name in [n for n in pending if all(d in results for d in self.nodes[n].inputs)]:
+                    node = self.nodes[name]
+                    kwargs = {dep: results[dep] for dep in node.inputs}
+                    running[pool.submit(node.func, **kwargs)] = name
+                    pending.remove(name)
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception:
+                        for other in running:
+                            other.cancel()
+                        raise
+        return results
@@ -58,6 +58,42 @@ class PortfolioConstructor:
             return target
         return adjusted / adjusted.sum()
 
+    def target_weights(
+        self,
+        scores_row: pd.Series,
+        returns: pd.DataFrame,
+        sectors: pd.Series,
+        method: str = "score_weighted",
+        prev: pd.Series | None = None,
+    ) -> pd.Series:
+        """Constrained target weights for one rebalance date.
+
+        ``returns`` must end at that date; ``prev`` is the previous weight row used
+        for the turnover cap. Returns an empty Series when nothing is selected.
+        """
+        row = scores_row.dropna()
+        selected = self._select_universe(row)
+        if selected.empty:
+            return pd.Series(dtype=float)
+
+        if method == "equal_weighted":
+            target = pd.Series(1 / len(selected), index=selected)
+        elif method == "risk_parity":
+            vol = returns[selected].tail(63).std().replace(0, np.nan)
+            inv_vol = 1 / vol
+            target = inv_vol / inv_vol.sum()
+        else:
+            raw = row[selected] - row[selected].min()
+            if raw.sum() == 0:
+                target = pd.Series(1 / len(selected), index=selected)
+            else:
+                target = raw / raw.sum()
+
+        target = target.clip(upper=self.max_weight)
+        target = target / target.sum()
+        target = self._apply_sector_cap(target, sectors)
+        return self._turnover_limited(target, prev)
+
     def construct(
         self,
         score: pd.DataFrame,
@@ -69,29 +105,10 @@ class PortfolioConstructor:
         prev = None
 
         for dt in score.index:
-            row = score.loc[dt].dropna()
-            selected = self._select_universe(row)
-            if selected.empty:
+            target = self.target_weights(score.loc[dt], returns.loc[:dt], sectors, method=method, prev=prev)
+            if target.empty:
                 continue
 
-            if method == "equal_weighted":
-                target = pd.Series(1 / len(selected), index=selected)
-            elif method == "risk_parity":
-                vol = returns[selected].loc[:dt].tail(63).std().replace(0, np.nan)
-                inv_vol = 1 / vol
-                target = inv_vol / inv_vol.sum()
-            else:
-                raw = row[selected] - row[selected].min()
-                if raw.sum() == 0:
-                    target = pd.Series(1 / len(selected), index=selected)
-                else:
-                    target = raw / raw.sum()
-
-            target = target.clip(upper=self.max_weight)
-            target = target / target.sum()
-            target = self._apply_sector_cap(target, sectors)
-            target = self._turnover_limited(target, prev)
-
             weights.loc[dt, target.index] = target.values
             prev = weights.loc[dt]
 
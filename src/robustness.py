@@ -3,6 +3,8 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
+from .metrics import max_drawdowns
+
 
 class RobustnessAnalyzer:
     def parameter_sweep(
@@ -55,22 +57,43 @@ class RobustnessAnalyzer:
             }
         )
 
-    def stress_period_performance(
+    def stress_period_performance_batch(
         self,
-        returns: pd.Series,
+        returns: pd.DataFrame,
         windows: dict[str, tuple[str, str]],
+        periods_per_year: int = 12,
     ) -> pd.DataFrame:
-        rows = []
+        """Stress-window statistics for every column of a (dates x strategies) matrix.
+
+        Missing values are ignored, so strategies that start on different dates are
+        not penalised; a strategy with no data in a window gets NaN statistics.
+        """
+        frames = []
         for name, (start, end) in windows.items():
-            s = returns.loc[start:end]
-            rows.append(
-                {
-                    "window": name,
-                    "start": start,
-                    "end": end,
-                    "total_return": (1 + s).prod() - 1 if not s.empty else np.nan,
-                    "vol": s.std() * np.sqrt(12) if not s.empty else np.nan,
-                    "hit_rate": (s > 0).mean() if not s.empty else np.nan,
-                }
+            # positional bounds by binary search on the sorted index, same labels as .loc[start:end]
+            lo, hi = returns.index.slice_locs(start, end)
+            s = returns.iloc[lo:hi]
+            no_data = (s.count() == 0).to_numpy()
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "window": name,
+                        "start": start,
+                        "end": end,
+                        "strategy": returns.columns,
+                        "total_return": np.where(no_data, np.nan, ((1 + s).prod() - 1).to_numpy()),
+                        "vol": (s.std() * np.sqrt(periods_per_year)).to_numpy(),
+                        "hit_rate": (s.gt(0).sum() / s.count()).to_numpy(dtype=float),
+                        "max_drawdown": max_drawdowns(s).to_numpy(),
+                    }
+                )
             )
-        return pd.DataFrame(rows)
+        return pd.concat(frames, ignore_index=True)
+
+    def stress_period_performance(
+        self,
+        returns: pd.Series,
+        windows: dict[str, tuple[str, str]],
+    ) -> pd.DataFrame:
+        batch = self.stress_period_performance_batch(returns.to_frame("strategy"), windows)
+        return batch[["window", "start", "end", "total_return", "vol", "hit_rate"]]